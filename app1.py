@@ -2,7 +2,10 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 import sympy as sp
+import time
+import builtins
 from sympy import symbols, diff, latex, solve
+from team_assets import build_thumbnails
 
 # ==================== KONFIGURASI HALAMAN ====================
 st.set_page_config(
@@ -12,6 +15,15 @@ st.set_page_config(
 )
 
 # ==================== FUNGSI BANTU ====================
+class _SymbolNamespace(dict):
+    """Namespace eval: nama yang tidak dikenal menjadi simbol parameter"""
+    def __missing__(self, name):
+        # Builtin (mis. abs) tetap dicari di builtins, bukan menjadi parameter
+        if name.startswith('_') or hasattr(builtins, name):
+            raise KeyError(name)
+        self[name] = sp.Symbol(name)
+        return self[name]
+
 def parse_function(func_str):
     """Mengubah string fungsi menjadi ekspresi sympy"""
     try:
@@ -30,7 +42,7 @@ def parse_function(func_str):
         func_str = func_str.replace('tan', 'sp.tan')
         
         # Parse menggunakan eval dengan namespace aman
-        safe_dict = {
+        safe_dict = _SymbolNamespace({
             'x': x,
             'sp': sp,
             'sin': sp.sin,
@@ -41,29 +53,116 @@ def parse_function(func_str):
             'sqrt': sp.sqrt,
             'pi': sp.pi,
             'e': sp.E
-        }
+        })
         
-        func = eval(func_str, {"_builtins_": None}, safe_dict)
+        func = sp.sympify(eval(func_str, {"_builtins_": None}, safe_dict))
         return func, x
         
     except Exception as e:
         st.error(f"Error parsing: {e}")
         return None, None
 
-def plot_function(func, x_sym, x_range=(-10, 10), title="Function Plot"):
+def get_parameters(func, x_sym):
+    """Simbol selain x (mis. a, b pada a*sin(b*x)), urut berdasarkan nama"""
+    return sorted(func.free_symbols - {x_sym}, key=lambda s: s.name)
+
+# Batas ukuran ekspresi (jumlah operasi) agar penyederhanaan tidak terlalu lama
+SIMPLIFY_MAX_OPS = 150
+# trigsimp jauh lebih mahal (detik untuk ~50 operasi), hanya untuk ekspresi kecil
+TRIGSIMP_MAX_OPS = 20
+# Batas waktu (detik); transformasi berikutnya dilewati jika sudah terlampaui
+SIMPLIFY_BUDGET = 0.15
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _canonicalize_cached(expr_key, max_ops):
+    """Penyederhanaan ekspresi, di-cache berdasarkan struktur (srepr)"""
+    deadline = time.perf_counter() + SIMPLIFY_BUDGET
+    expr = sp.sympify(expr_key)
+    size_before = sp.count_ops(expr)
+    best, best_size = expr, size_before
+
+    # Lewati transformasi mahal jika ekspresi terlalu besar
+    if size_before <= max_ops:
+        candidates = [sp.cancel, sp.factor]
+        if size_before <= TRIGSIMP_MAX_OPS and expr.has(sp.sin, sp.cos, sp.tan):
+            candidates.append(sp.trigsimp)
+
+        for transform in candidates:
+            if time.perf_counter() > deadline:
+                break
+            try:
+                candidate = transform(best)
+            except Exception:
+                continue
+            candidate_size = sp.count_ops(candidate)
+            if candidate_size < best_size:
+                best, best_size = candidate, candidate_size
+
+    return best, size_before, best_size
+
+def canonicalize_expression(expr, max_ops=SIMPLIFY_MAX_OPS):
+    """Menyederhanakan ekspresi (cancel/factor/trigsimp) dan melaporkan ukurannya"""
+    return _canonicalize_cached(sp.srepr(expr), max_ops)
+
+@st.cache_resource(show_spinner=False, max_entries=128)
+def _compile_cached(expr_key, symbol_names, use_cse):
+    """Kompilasi lambdify, di-cache berdasarkan struktur ekspresi (srepr)"""
+    args = [sp.Symbol(name) for name in symbol_names]
+    return sp.lambdify(args, sp.sympify(expr_key), 'numpy', cse=use_cse)
+
+def compile_function(func, x_sym, use_cse=False, params=(), values=()):
+    """Mengubah ekspresi sympy menjadi fungsi numpy f(x); parameter diikat ke values"""
+    symbol_names = (x_sym.name,) + tuple(p.name for p in params)
+    family_numpy = _compile_cached(sp.srepr(func), symbol_names, use_cse)
+    if not params:
+        return family_numpy
+    # Parameter menjadi argumen tambahan dari satu fungsi terkompilasi
+    values = tuple(values)
+    return lambda x_val: family_numpy(x_val, *values)
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _diff_cached(expr_key, x_name):
+    """Turunan simbolik, di-cache berdasarkan struktur ekspresi (srepr)"""
+    return sp.diff(sp.sympify(expr_key), sp.Symbol(x_name))
+
+def symbolic_derivative(func, x_sym):
+    """sp.diff terhadap x dengan cache"""
+    return _diff_cached(sp.srepr(func), x_sym.name)
+
+def evaluate_on_grid(func_numpy, x_vals):
+    """Evaluasi vektor pada grid x; nilai tidak real menjadi NaN"""
+    with np.errstate(all='ignore'):
+        y_vals = np.asarray(func_numpy(x_vals))
+    if np.iscomplexobj(y_vals):
+        y_vals = np.where(np.abs(y_vals.imag) < 1e-12, y_vals.real, np.nan)
+    # Fungsi konstan menghasilkan skalar, perluas ke bentuk grid
+    return np.broadcast_to(y_vals, x_vals.shape).astype(float)
+
+def plot_function(func, x_sym, x_range=(-10, 10), title="Function Plot", use_cse=False,
+                  samples=None, points=None):
     """Membuat plot fungsi matematika dengan error handling"""
     try:
-        x_vals = np.linspace(x_range[0], x_range[1], 400)
-        
-        # Convert sympy function to numpy function
-        func_numpy = sp.lambdify(x_sym, func, 'numpy')
-        y_vals = func_numpy(x_vals)
+        if samples is None:
+            x_vals = np.linspace(x_range[0], x_range[1], 400)
+            
+            # Convert sympy function to numpy function
+            func_numpy = compile_function(func, x_sym, use_cse)
+            y_vals = evaluate_on_grid(func_numpy, x_vals)
+        else:
+            # Gunakan sampel yang sudah dievaluasi
+            x_vals, y_vals = samples
         
         # Handle NaN or inf values
         y_vals = np.nan_to_num(y_vals, nan=0.0, posinf=10, neginf=-10)
         
         fig, ax = plt.subplots(figsize=(10, 6))
         ax.plot(x_vals, y_vals, 'b-', linewidth=2, label=f'f(x)')
+        
+        # Tandai titik-titik tambahan (label, style, xs, ys)
+        for label, style, xs, ys in points or []:
+            if len(xs):
+                ax.plot(xs, ys, style["fmt"], markersize=8, label=label)
+        
         ax.set_xlabel('x')
         ax.set_ylabel('f(x)')
         ax.set_title(title)
@@ -81,6 +180,342 @@ def plot_function(func, x_sym, x_range=(-10, 10), title="Function Plot"):
         ax.set_title("Plot Error")
         return fig
 
+def show_interactive_plot(x_vals, y_vals, x_range, title, points=None):
+    """Plot Vega-Lite dirender di browser: rerun slider hanya mengirim data baru, tanpa rasterisasi PNG"""
+    # Handle NaN or inf values (sama seperti plot_function)
+    y_vals = np.nan_to_num(y_vals, nan=0.0, posinf=10, neginf=-10)
+    x_encoding = {"field": "x", "type": "quantitative", "title": "x",
+                  "scale": {"domain": [float(x_range[0]), float(x_range[1])]}}
+    y_encoding = {"field": "y", "type": "quantitative", "title": "f(x)"}
+    
+    layers = [{
+        "data": {"values": [{"x": float(a), "y": float(b)} for a, b in zip(x_vals, y_vals)]},
+        "mark": {"type": "line", "color": "blue", "strokeWidth": 2, "clip": True},
+        "encoding": {"x": x_encoding, "y": y_encoding},
+    }]
+    
+    # Tandai titik-titik tambahan (label, style, xs, ys)
+    marker_values, labels, colors, shapes = [], [], [], []
+    for label, style, xs, ys in points or []:
+        if len(xs):
+            marker_values += [{"x": float(a), "y": float(b), "titik": label} for a, b in zip(xs, ys)]
+            labels.append(label)
+            colors.append(style["color"])
+            shapes.append(style["shape"])
+    if marker_values:
+        layers.append({
+            "data": {"values": marker_values},
+            "mark": {"type": "point", "filled": True, "size": 80},
+            "encoding": {
+                "x": x_encoding,
+                "y": y_encoding,
+                "color": {"field": "titik", "type": "nominal", "title": None,
+                          "scale": {"domain": labels, "range": colors}},
+                "shape": {"field": "titik", "type": "nominal", "title": None,
+                          "scale": {"domain": labels, "range": shapes}},
+                "tooltip": [{"field": "x", "format": ".4f"}, {"field": "y", "format": ".4f"}, {"field": "titik"}],
+            },
+        })
+    
+    spec = {
+        # Judul multi-baris (sp.pretty) tetap rapi dengan font monospace
+        "title": {"text": title.split("\n"), "font": "monospace"},
+        "height": 400,
+        "layer": layers,
+    }
+    st.vega_lite_chart(spec, use_container_width=True)
+
+# ==================== MESIN TURUNAN ====================
+# Batas ukuran ekspresi; di atas ini turunan dihitung secara numerik
+DERIVATIVE_MAX_OPS = 300
+
+DERIVATIVE_MODES = ["Otomatis", "Simbolik", "Numerik (complex-step)", "Numerik (beda hingga)"]
+
+# Fungsi tidak analitik: complex-step tidak berlaku, gunakan beda hingga
+NON_ANALYTIC = (sp.Piecewise, sp.Abs, sp.sign, sp.floor, sp.ceiling, sp.Min, sp.Max, sp.Heaviside)
+
+# Ukuran langkah optimal untuk beda pusat orde 1 dan orde 2
+FD_STEP = np.finfo(float).eps ** (1 / 3)
+FD2_STEP = np.finfo(float).eps ** (1 / 4)
+COMPLEX_STEP = 1e-20
+
+# Kelipatan eps*|f|/h^n di bawah mana hasil beda hingga dianggap noise pembulatan
+FD_NOISE_FACTOR = 100
+
+def symbolic_cost_exceeded(expr, max_ops=DERIVATIVE_MAX_OPS):
+    """Cek apakah turunan simbolik terlalu mahal (fungsi non-analitik atau ekspresi besar)"""
+    return expr.has(*NON_ANALYTIC) or sp.count_ops(expr) > max_ops
+
+def compile_derivative(derivative, x_sym, x_vals, use_cse=False, params=(), values=()):
+    """Kompilasi turunan simbolik; None jika masih memuat Derivative (mis. Abs -> re/im) atau gagal dievaluasi"""
+    if derivative.has(sp.Derivative):
+        return None
+    try:
+        derivative_numpy = compile_function(derivative, x_sym, use_cse, params, values)
+        evaluate_on_grid(derivative_numpy, x_vals)
+    except Exception:
+        return None
+    return derivative_numpy
+
+def complex_step_derivative(func_numpy, h=COMPLEX_STEP):
+    """f'(x) ≈ Im(f(x + ih)) / h, akurat hingga presisi mesin untuk fungsi analitik"""
+    def derivative(x_val):
+        x_val = np.asarray(x_val, dtype=float)
+        value = np.imag(func_numpy(x_val + 1j * h)) / h
+        # Di luar domain real f, turunan tidak terdefinisi
+        return np.where(np.isfinite(func_numpy(x_val)), value, np.nan)
+    return derivative
+
+def central_difference_derivative(func_numpy):
+    """f'(x) ≈ (f(x + h) - f(x - h)) / 2h"""
+    def derivative(x_val):
+        h = FD_STEP * np.maximum(1.0, np.abs(x_val))
+        return (func_numpy(x_val + h) - func_numpy(x_val - h)) / (2 * h)
+    return derivative
+
+def central_second_derivative(func_numpy):
+    """f''(x) ≈ (f(x + h) - 2f(x) + f(x - h)) / h²"""
+    def second(x_val):
+        h = FD2_STEP * np.maximum(1.0, np.abs(x_val))
+        return (func_numpy(x_val + h) - 2 * func_numpy(x_val) + func_numpy(x_val - h)) / h ** 2
+    return second
+
+def numeric_derivative(func, func_numpy, x_vals, method="complex-step"):
+    """Turunan numerik; complex-step jika berlaku, selain itu beda hingga"""
+    if method == "complex-step" and not func.has(*NON_ANALYTIC):
+        derivative = complex_step_derivative(func_numpy)
+        try:
+            dy_vals = evaluate_on_grid(derivative, x_vals)
+            y_vals = evaluate_on_grid(func_numpy, x_vals)
+            if np.all(np.isfinite(dy_vals[np.isfinite(y_vals)])):
+                return derivative, "complex-step"
+        except Exception:
+            pass
+    return central_difference_derivative(func_numpy), "beda hingga"
+
+def compute_derivative(func, x_sym, func_numpy, x_vals, mode="Otomatis", simplify=True,
+                       params=(), values=()):
+    """Menghitung f' secara simbolik bila murah, atau numerik bila biaya melebihi batas"""
+    result = {"expr": None, "size": None, "fallback": False}
+    
+    if mode == "Simbolik" or (mode == "Otomatis" and not symbolic_cost_exceeded(func)):
+        derivative = symbolic_derivative(func, x_sym)
+        if mode == "Simbolik" or not symbolic_cost_exceeded(derivative):
+            size = None
+            if simplify:
+                derivative, size_before, size_after = canonicalize_expression(derivative)
+                size = (size_before, size_after)
+            derivative_numpy = compile_derivative(derivative, x_sym, x_vals, simplify, params, values)
+            if derivative_numpy is not None:
+                result.update(expr=derivative, size=size, method="simbolik", numpy=derivative_numpy)
+                return result
+    
+    result["fallback"] = mode in ("Otomatis", "Simbolik")
+    method = "beda hingga" if mode == "Numerik (beda hingga)" else "complex-step"
+    result["numpy"], result["method"] = numeric_derivative(func, func_numpy, x_vals, method)
+    return result
+
+def second_derivative_numpy(derivative_info, x_sym, func_numpy, params=(), values=(), deadline=None):
+    """f'' sebagai fungsi numpy: (fungsi, numerik?); beda hingga jika f' numerik/terlalu besar atau waktu habis"""
+    def in_time():
+        return deadline is None or time.perf_counter() < deadline
+
+    derivative = derivative_info["expr"]
+    if derivative is not None and not symbolic_cost_exceeded(derivative) and in_time():
+        second = symbolic_derivative(derivative, x_sym)
+        # Tanpa CSE: lambdify dengan CSE bisa memakan ratusan ms untuk f'' yang besar
+        if not symbolic_cost_exceeded(second) and not second.has(sp.Derivative) and in_time():
+            try:
+                return compile_function(second, x_sym, False, params, values), False
+            except Exception:
+                pass
+    return central_second_derivative(func_numpy), True
+
+def finite_difference_noise(y_vals, order):
+    """Batas noise pembulatan beda hingga orde 1/2, relatif terhadap skala f pada grid"""
+    step = FD_STEP if order == 1 else FD2_STEP
+    finite = np.abs(y_vals[np.isfinite(y_vals)])
+    scale = max(1.0, finite.max() if finite.size else 1.0)
+    return FD_NOISE_FACTOR * np.finfo(float).eps * scale / step ** order
+
+def derivative_noise_floor(derivative_info, y_vals):
+    """Noise floor untuk f'; nol jika dihitung simbolik atau dengan complex-step"""
+    if derivative_info["method"] == "beda hingga":
+        return finite_difference_noise(y_vals, 1)
+    return 0.0
+
+def cross_check_derivative(func, x_sym, func_numpy, x_vals, dy_vals, derivative_info,
+                           params=(), values=()):
+    """Validasi silang simbolik vs numerik; galat maksimum (absolut, relatif), None jika tidak bisa dibandingkan"""
+    if derivative_info["expr"] is not None:
+        other, _ = numeric_derivative(func, func_numpy, x_vals)
+    else:
+        other = compile_derivative(symbolic_derivative(func, x_sym), x_sym, x_vals, False, params, values)
+        if other is None:
+            return None
+    other_vals = evaluate_on_grid(other, x_vals)
+    
+    mask = np.isfinite(dy_vals) & np.isfinite(other_vals)
+    if not mask.any():
+        return None
+    max_error = np.max(np.abs(dy_vals[mask] - other_vals[mask]))
+    scale = max(1.0, np.max(np.abs(other_vals[mask])))
+    return max_error, max_error / scale
+
+# Batas waktu (detik) pencarian akar, ekstrem & titik belok per rerun
+SPECIAL_POINTS_BUDGET = 0.25
+MAX_POINTS_PER_KIND = 20
+
+# Gaya marker: format matplotlib (plot_function) dan warna/bentuk Vega-Lite (show_interactive_plot)
+SPECIAL_POINT_STYLES = {
+    "roots": ("Akar", {"fmt": "ko", "color": "black", "shape": "circle"}),
+    "maxima": ("Maksimum lokal", {"fmt": "r^", "color": "red", "shape": "triangle-up"}),
+    "minima": ("Minimum lokal", {"fmt": "gv", "color": "green", "shape": "triangle-down"}),
+    "inflections": ("Titik belok", {"fmt": "ms", "color": "magenta", "shape": "square"}),
+}
+
+def _eval_scalar(func_numpy, x_val):
+    """Evaluasi skalar yang aman (error/kompleks -> NaN)"""
+    try:
+        with np.errstate(all='ignore'):
+            value = complex(func_numpy(x_val))
+    except Exception:
+        return np.nan
+    return value.real if abs(value.imag) < 1e-12 else np.nan
+
+def find_sign_changes(x_vals, y_vals):
+    """Mencari bracket [a, b] tempat sampel berganti tanda, beserta arahnya (+1 naik, -1 turun)"""
+    sign = np.sign(y_vals)
+    # Dua sampel berurutan berbeda tanda (NaN otomatis diabaikan)
+    idx = np.nonzero(sign[:-1] * sign[1:] < 0)[0]
+    # Sampel tepat nol yang diapit tanda berbeda
+    zero = np.nonzero((sign[1:-1] == 0) & (sign[:-2] * sign[2:] < 0))[0] + 1
+
+    a = np.concatenate([x_vals[idx], x_vals[zero]])
+    b = np.concatenate([x_vals[idx + 1], x_vals[zero]])
+    direction = np.concatenate([sign[idx + 1], sign[zero + 1]])
+    order = np.argsort(a)
+    return a[order], b[order], direction[order]
+
+def refine_root(func_numpy, a, b, xtol=1e-12, max_iter=60):
+    """Menyempurnakan akar di dalam bracket [a, b] dengan metode Illinois (regula falsi)"""
+    if a == b:
+        return a
+    fa, fb = _eval_scalar(func_numpy, a), _eval_scalar(func_numpy, b)
+    if not (np.isfinite(fa) and np.isfinite(fb)) or fa * fb > 0:
+        return None
+
+    c = a
+    for _ in range(max_iter):
+        c = b - fb * (b - a) / (fb - fa)
+        fc = _eval_scalar(func_numpy, c)
+        if not np.isfinite(fc):
+            return None
+        if fc == 0 or abs(b - a) < xtol * (1 + abs(c)):
+            break
+        if fc * fb < 0:
+            a, fa = b, fb
+        else:
+            fa *= 0.5
+        b, fb = c, fc
+    return c
+
+def locate_zeros(func_numpy, x_vals, y_vals, deadline, max_points=MAX_POINTS_PER_KIND, noise_floor=0.0):
+    """Titik nol dari sampel, disempurnakan satu per satu selama waktu masih tersedia"""
+    # Nilai di bawah noise floor (hasil beda hingga) dianggap nol, bukan perubahan tanda
+    if noise_floor:
+        y_vals = np.where(np.abs(y_vals) <= noise_floor, 0.0, y_vals)
+    a, b, direction = find_sign_changes(x_vals, y_vals)
+    truncated = len(a) > max_points
+
+    # Toleransi relatif terhadap skala sampel, untuk menolak kutub (mis. tan, 1/x)
+    finite = np.abs(y_vals[np.isfinite(y_vals)])
+    tol = max(1e-6 * max(1.0, finite.max() if finite.size else 1.0), noise_floor)
+
+    zeros, directions = [], []
+    for a_i, b_i, d_i in zip(a[:max_points], b[:max_points], direction[:max_points]):
+        if time.perf_counter() > deadline:
+            truncated = True
+            break
+        root = refine_root(func_numpy, a_i, b_i)
+        if root is not None and abs(_eval_scalar(func_numpy, root)) <= tol:
+            zeros.append(root)
+            directions.append(d_i)
+    return zeros, directions, truncated
+
+def find_special_points(func_numpy, derivative_numpy, build_second, x_vals, y_vals, dy_vals,
+                        budget=SPECIAL_POINTS_BUDGET, derivative_noise=0.0):
+    """Akar, ekstrem lokal dan titik belok dari sampel f, f', f'' dalam batas waktu
+
+    build_second(deadline) -> (f'' numpy, numerik?) dipanggil di dalam batas waktu.
+    """
+    start = time.perf_counter()
+    deadline = start + budget
+    second_numpy, second_numeric = build_second(deadline)
+    d2y_vals = evaluate_on_grid(second_numpy, x_vals)
+    second_noise = finite_difference_noise(y_vals, 2) if second_numeric else 0.0
+
+    roots, _, cut_f = locate_zeros(func_numpy, x_vals, y_vals, deadline)
+    critical, directions, cut_df = locate_zeros(derivative_numpy, x_vals, dy_vals, deadline,
+                                                noise_floor=derivative_noise)
+    inflections, _, cut_d2f = locate_zeros(second_numpy, x_vals, d2y_vals, deadline,
+                                           noise_floor=second_noise)
+
+    def with_values(xs):
+        points = [(x_val, _eval_scalar(func_numpy, x_val)) for x_val in xs]
+        return [(x_val, y_val) for x_val, y_val in points if np.isfinite(y_val)]
+
+    return {
+        "roots": [(x_val, 0.0) for x_val in roots],
+        # f' berubah dari + ke - -> maksimum, dari - ke + -> minimum
+        "maxima": with_values([c for c, d in zip(critical, directions) if d < 0]),
+        "minima": with_values([c for c, d in zip(critical, directions) if d > 0]),
+        "inflections": with_values(inflections),
+        "elapsed": time.perf_counter() - start,
+        "truncated": cut_f or cut_df or cut_d2f,
+    }
+
+def special_point_markers(special):
+    """Mengubah hasil find_special_points menjadi marker untuk plot_function"""
+    markers = []
+    for kind, (label, style) in SPECIAL_POINT_STYLES.items():
+        points = special[kind]
+        markers.append((label, style, [p[0] for p in points], [p[1] for p in points]))
+    return markers
+
+def show_special_points(special):
+    """Menampilkan daftar akar, ekstrem dan titik belok"""
+    columns = st.columns(len(SPECIAL_POINT_STYLES))
+    for column, (kind, (label, _)) in zip(columns, SPECIAL_POINT_STYLES.items()):
+        with column:
+            st.write(f"*{label}:*")
+            if special[kind]:
+                st.code("\n".join(f"x = {x_val:.4f}, f(x) = {y_val:.4f}" for x_val, y_val in special[kind]))
+            else:
+                st.caption("Tidak ditemukan")
+
+    st.caption(f"Waktu pencarian: {special['elapsed'] * 1000:.1f} ms")
+    if special["truncated"]:
+        st.warning("Sebagian titik tidak diproses karena batas waktu/jumlah titik tercapai")
+
+@st.cache_resource(show_spinner=False)
+def _team_photos():
+    """Thumbnail semua foto tim di memori; yang belum ada diunduh sekali per proses"""
+    return build_thumbnails()
+
+def load_team_photo(slug):
+    """Thumbnail foto anggota tim, None jika tidak tersedia (gagal diunduh tidak dicoba lagi)"""
+    return _team_photos().get(slug)
+
+def show_team_photo(slug, caption):
+    """Menampilkan foto anggota tim, dengan placeholder jika sumber tidak terjangkau"""
+    photo = load_team_photo(slug)
+    if photo is not None:
+        st.image(photo, width=150, caption=caption)
+    else:
+        st.markdown("### 👤")
+        st.caption(f"{caption} (foto tidak tersedia)")
+
 # ==================== HALAMAN 1: ANGGOTA TIM ====================
 def show_team_page():
     st.title("👥 Anggota Tim")
@@ -93,11 +528,7 @@ def show_team_page():
     
     with col1:
         st.markdown("### 🧠 Dwy Nursari")
-        st.image(
-            "https://img.sanishtech.com/u/56325981e4b73d85858c1c503b5b73cb.jpg",
-            width=150,
-            caption="Project Manager & Full Stack Developer"
-        )
+        show_team_photo("dwy_nursari", "Project Manager & Full Stack Developer")
         st.write("*ID:* 004202505035")
         st.write("*Peran:* Project Leader")
         st.info("""
@@ -110,11 +541,7 @@ def show_team_page():
     
     with col2:
         st.markdown("### 🎨 Adhitya Suseno ")
-        st.image(
-            "https://img.sanishtech.com/u/e97ac70f3dbe832a0ee2c2c0e5a33dfe.jpg",
-            width=150,
-            caption="Frontend Developer & UI/UX Designer"
-        )
+        show_team_photo("adhitya_suseno", "Frontend Developer & UI/UX Designer")
         st.write("*ID:* 004202505051")
         st.write("*Peran:* Frontend Specialist")
         st.info("""
@@ -130,11 +557,7 @@ def show_team_page():
     
     with col3:
         st.markdown("### 🔢 Alvina Nazwa")
-        st.image(
-            "https://img.sanishtech.com/u/bd9e17d8183379d999c5028b05b046ec.jpg",
-            width=150,
-            caption="Mathematics & Algorithm Specialist"
-        )
+        show_team_photo("alvina_nazwa", "Mathematics & Algorithm Specialist")
         st.write("*ID:* 004202505036")
         st.write("*Peran:* Math Expert")
         st.info("""
@@ -147,11 +570,7 @@ def show_team_page():
     
     with col4:
         st.markdown("### 🧪Julian Nauval Saputra")
-        st.image(
-            "https://img.sanishtech.com/u/40ec2b8a5f71f27324ed6436aa426c37.jpg",
-            width=150,
-            caption="Testing & Documentation Specialist"
-        )
+        show_team_photo("julian_nauval_saputra", "Testing & Documentation Specialist")
         st.write("*ID:* 004202505047")
         st.write("*Peran:* QA & Documentation")
         st.info("""
@@ -179,10 +598,12 @@ def show_team_page():
 
 # ==================== HALAMAN 2: VISUALISASI FUNGSI ====================
 def show_function_page():
+    # Waktu rerun penuh: parse, tampilan rumus, slider, turunan dan plot
+    start_time = time.perf_counter()
     st.title("📈 Visualisasi Fungsi & Turunan")
     st.markdown("---")
     
-    st.info("💡 *Contoh fungsi yang bisa dicoba:* x*2, x3 - 3*x*2 + 2, sin(x), exp(x), log(x+1)")
+    st.info("💡 *Contoh fungsi yang bisa dicoba:* x*2, x3 - 3*x*2 + 2, sin(x), exp(x), log(x+1), a*sin(b*x)")
     
     col1, col2 = st.columns([2, 1])
     
@@ -191,13 +612,33 @@ def show_function_page():
         func_input = st.text_input(
             "Masukkan fungsi f(x):",
             value="x**2",
-            help="Gunakan x sebagai variabel. Contoh: x**2 + 2*x + 1"
+            help="Gunakan x sebagai variabel, huruf lain menjadi parameter. Contoh: x**2 + 2*x + 1, a*sin(b*x)"
         )
     
     with col2:
         st.subheader("Rentang Plot")
         x_min = st.number_input("x minimum", value=-5.0)
         x_max = st.number_input("x maksimum", value=5.0)
+        simplify_derivative = st.checkbox(
+            "Sederhanakan turunan",
+            value=True,
+            help="Kanonikalisasi turunan (cancel/factor/trigsimp + CSE) agar render dan evaluasi lebih cepat"
+        )
+        derivative_mode = st.selectbox(
+            "Metode turunan",
+            DERIVATIVE_MODES,
+            help="Otomatis: simbolik, beralih ke numerik jika ekspresi terlalu besar/Piecewise"
+        )
+        cross_check = st.checkbox(
+            "Validasi silang simbolik vs numerik",
+            value=False,
+            help="Membandingkan kedua metode pada grid untuk mendeteksi kesalahan parsing"
+        )
+        show_points = st.checkbox(
+            "Tandai akar, ekstrem & titik belok",
+            value=True,
+            help="Dicari dari sampel plot (perubahan tanda f, f', f'') dalam batas waktu tetap"
+        )
     
     if func_input:
         with st.spinner("Memproses fungsi..."):
@@ -216,30 +657,114 @@ def show_function_page():
                     st.write("*Format LaTeX:*")
                     st.latex(f"f(x) = {sp.latex(func)}")
                 
+                # Parameter fungsi (mis. a, b) dikendalikan slider
+                params = get_parameters(func, x)
+                values = ()
+                if params:
+                    st.subheader("🎚️ Parameter")
+                    slider_cols = st.columns(min(len(params), 4))
+                    values = tuple(
+                        slider_cols[i % len(slider_cols)].slider(
+                            p.name, min_value=-10.0, max_value=10.0, value=1.0, step=0.1, key=f"param_{p.name}"
+                        )
+                        for i, p in enumerate(params)
+                    )
+                    update_timer = st.empty()
+                
+                # Sampel grid dipakai bersama oleh plot dan pencarian titik penting
+                x_vals = np.linspace(x_min, x_max, 400)
+                
+                # Calculate derivative
+                func_numpy, derivative_info, derivative_error = None, None, None
+                try:
+                    func_numpy = compile_function(func, x, params=params, values=values)
+                    derivative_info = compute_derivative(func, x, func_numpy, x_vals,
+                                                         derivative_mode, simplify_derivative, params, values)
+                    derivative_numpy = derivative_info["numpy"]
+                    dy_vals = evaluate_on_grid(derivative_numpy, x_vals)
+                except Exception as e:
+                    derivative_error = e
+                
                 # Plot original function
                 st.subheader("📊 Plot Fungsi Asli")
                 try:
-                    fig_original = plot_function(func, x, (x_min, x_max), f"Fungsi: {func_input}")
-                    st.pyplot(fig_original)
+                    if func_numpy is None:
+                        func_numpy = compile_function(func, x, params=params, values=values)
+                    y_vals = evaluate_on_grid(func_numpy, x_vals)
+                    
+                    special = None
+                    if show_points and derivative_error is None:
+                        def build_second(deadline):
+                            return second_derivative_numpy(derivative_info, x, func_numpy,
+                                                           params, values, deadline)
+                        special = find_special_points(func_numpy, derivative_numpy, build_second,
+                                                      x_vals, y_vals, dy_vals,
+                                                      derivative_noise=derivative_noise_floor(derivative_info, y_vals))
+                    
+                    markers = special_point_markers(special) if special else None
+                    if params:
+                        # Fungsi berparameter: plot di browser agar geser slider tetap ringan
+                        show_interactive_plot(x_vals, y_vals, (x_min, x_max), f"Fungsi: {func_input}", markers)
+                    else:
+                        fig_original = plot_function(func, x, (x_min, x_max), f"Fungsi: {func_input}",
+                                                     samples=(x_vals, y_vals), points=markers)
+                        st.pyplot(fig_original)
+                    
+                    if special:
+                        show_special_points(special)
                 except Exception as e:
                     st.error(f"Error plotting fungsi: {e}")
                 
-                # Calculate derivative
                 st.subheader("🧮 Kalkulasi Turunan")
-                try:
-                    derivative = sp.diff(func, x)
+                if derivative_error is None:
+                    derivative = derivative_info["expr"]
+                    if derivative is not None:
+                        st.write("*Turunan Fungsi:*")
+                        st.code(f"f'(x) = {sp.pretty(derivative)}")
+                        st.latex(f"f'(x) = {sp.latex(derivative)}")
+                        if derivative_info["size"]:
+                            size_before, size_after = derivative_info["size"]
+                            st.caption(f"Ukuran ekspresi turunan: {size_before} → {size_after} operasi")
+                        derivative_title = f"Turunan: {sp.pretty(derivative)}"
+                    else:
+                        if derivative_info["fallback"]:
+                            st.info(f"Turunan simbolik tidak tersedia atau terlalu mahal "
+                                    f"(fungsi non-analitik/ekspresi besar), "
+                                    f"f'(x) dihitung secara numerik ({derivative_info['method']})")
+                        else:
+                            st.info(f"f'(x) dihitung secara numerik ({derivative_info['method']})")
+                        derivative_title = f"Turunan numerik ({derivative_info['method']})"
                     
-                    st.write("*Turunan Fungsi:*")
-                    st.code(f"f'(x) = {sp.pretty(derivative)}")
-                    st.latex(f"f'(x) = {sp.latex(derivative)}")
+                    if cross_check:
+                        try:
+                            check = cross_check_derivative(func, x, func_numpy, x_vals, dy_vals, derivative_info,
+                                                           params, values)
+                            if check is None:
+                                st.warning("Validasi silang tidak tersedia: turunan simbolik tidak terdefinisi "
+                                           "atau tidak ada titik grid yang valid")
+                            else:
+                                max_error, relative_error = check
+                                message = f"Validasi silang: galat maksimum {max_error:.3e} (relatif {relative_error:.3e})"
+                                if relative_error > 1e-4:
+                                    st.warning(f"{message} — hasil simbolik dan numerik berbeda, periksa input fungsi")
+                                else:
+                                    st.success(message)
+                        except Exception as e:
+                            st.error(f"Error validasi silang: {e}")
                     
                     # Plot derivative
                     st.subheader("📈 Plot Fungsi Turunan")
-                    fig_derivative = plot_function(derivative, x, (x_min, x_max), f"Turunan: {sp.pretty(derivative)}")
-                    st.pyplot(fig_derivative)
-                    
-                except Exception as e:
-                    st.error(f"Error menghitung turunan: {e}")
+                    if params:
+                        show_interactive_plot(x_vals, dy_vals, (x_min, x_max), derivative_title)
+                    else:
+                        fig_derivative = plot_function(derivative, x, (x_min, x_max), derivative_title,
+                                                       samples=(x_vals, dy_vals))
+                        st.pyplot(fig_derivative)
+                else:
+                    st.error(f"Error menghitung turunan: {derivative_error}")
+                
+                if params:
+                    update_timer.caption(f"⏱️ Evaluasi ulang: {(time.perf_counter() - start_time) * 1000:.1f} ms")
                 
             else:
                 st.error("❌ Tidak dapat memproses fungsi. Pastikan format benar!")
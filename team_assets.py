@@ -0,0 +1,80 @@
+import io
+import sys
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+# ==================== KONFIGURASI ASET ====================
+# Build step (disarankan sebelum deploy): python team_assets.py [--force]
+# Membuat thumbnail di assets/team/. Jika belum ada, app mengunduhnya sendiri
+# sekali per proses saat halaman tim pertama dibuka; foto yang gagal diunduh
+# tidak dicoba lagi dan ditampilkan sebagai placeholder.
+ASSET_DIR = Path(__file__).parent / "assets" / "team"
+
+# Ukuran 2x dari lebar tampilan (150px) agar tetap tajam di layar HiDPI
+THUMBNAIL_SIZE = (300, 300)
+THUMBNAIL_QUALITY = 85
+FETCH_TIMEOUT = 5  # detik
+
+# Sumber asli foto anggota tim
+TEAM_PHOTOS = {
+    "dwy_nursari": "https://img.sanishtech.com/u/56325981e4b73d85858c1c503b5b73cb.jpg",
+    "adhitya_suseno": "https://img.sanishtech.com/u/e97ac70f3dbe832a0ee2c2c0e5a33dfe.jpg",
+    "alvina_nazwa": "https://img.sanishtech.com/u/bd9e17d8183379d999c5028b05b046ec.jpg",
+    "julian_nauval_saputra": "https://img.sanishtech.com/u/40ec2b8a5f71f27324ed6436aa426c37.jpg",
+}
+
+# ==================== FUNGSI BANTU ====================
+def thumbnail_path(slug):
+    """Lokasi file thumbnail lokal untuk anggota tim"""
+    return ASSET_DIR / f"{slug}.jpg"
+
+def fetch_remote(url, timeout=FETCH_TIMEOUT):
+    """Mengunduh gambar asli dari URL"""
+    request = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.read()
+
+def make_thumbnail(raw_bytes):
+    """Mengubah ukuran dan mengompres gambar menjadi thumbnail JPEG"""
+    image = Image.open(io.BytesIO(raw_bytes))
+    image = image.convert("RGB")
+    image.thumbnail(THUMBNAIL_SIZE, Image.LANCZOS)
+
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=THUMBNAIL_QUALITY, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+def build_thumbnail(slug, force=False):
+    """Thumbnail satu anggota tim: dari file lokal, atau diunduh lalu disimpan"""
+    path = thumbnail_path(slug)
+    if path.exists() and not force:
+        return path.read_bytes()
+
+    data = make_thumbnail(fetch_remote(TEAM_PHOTOS[slug]))
+    try:
+        ASSET_DIR.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    except OSError:
+        pass  # Filesystem read-only: thumbnail tetap dipakai dari memori
+    return data
+
+def build_thumbnails(force=False):
+    """Membuat semua thumbnail secara paralel; {slug: bytes, atau None jika gagal}"""
+    def build(slug):
+        try:
+            return build_thumbnail(slug, force)
+        except Exception:
+            return None
+
+    with ThreadPoolExecutor(max_workers=len(TEAM_PHOTOS)) as pool:
+        return dict(zip(TEAM_PHOTOS, pool.map(build, TEAM_PHOTOS)))
+
+if __name__ == "__main__":
+    for slug, data in build_thumbnails(force="--force" in sys.argv).items():
+        if data is None:
+            print(f"[gagal] {slug}")
+        else:
+            print(f"[ok]   {thumbnail_path(slug).name} ({len(data) // 1024} KB)")